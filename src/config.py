@@ -5,12 +5,13 @@ This module provides centralized configuration management with
 environment variable support and validation.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 
 @dataclass
@@ -25,12 +26,15 @@ class ProcessingConfig:
 
     # Processing Configuration
     batch_size: int = 5
+    max_workers: int = 4
     max_file_size_mb: int = 50
     allowed_extensions: list = field(default_factory=lambda: ['.pdf'])
 
     # Storage Configuration
     hash_algorithm: str = "sha256"
-    csv_chunk_size: int = 1000
+    csv_chunk_size: int = 100_000
+    bloom_filter_threshold: int = 1_000_000
+    bloom_filter_capacity: int = 10_000_000
 
     # Directories
     data_dir: str = "data"
@@ -60,12 +64,24 @@ class ProcessingConfig:
         if self.batch_size <= 0:
             raise ValueError("Batch size must be positive")
 
+        if self.max_workers <= 0:
+            raise ValueError("Max workers must be positive")
+
         if self.max_file_size_mb <= 0:
             raise ValueError("Max file size must be positive")
 
         if self.api_timeout <= 0:
             raise ValueError("API timeout must be positive")
 
+        if self.csv_chunk_size <= 0:
+            raise ValueError("CSV chunk size must be positive")
+
+        if self.bloom_filter_threshold < 0:
+            raise ValueError("Bloom filter threshold cannot be negative")
+
+        if self.bloom_filter_capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+
         if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
 
@@ -81,6 +97,72 @@ class ProcessingConfig:
             Path(self.log_file_path).parent.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(env_file: str, env_file_mtime: Optional[float]) -> ProcessingConfig:
+    """
+    Load and validate configuration, memoized per environment file version.
+
+    The mtime is part of the cache key so that editing the environment
+    file is picked up on the next load without an explicit invalidation.
+    The file is read directly rather than exported into ``os.environ``,
+    where its earlier values would shadow the edits; variables already set
+    in the process environment take precedence over it.
+
+    Args:
+        env_file: Path to environment file
+        env_file_mtime: Modification time of the file, or None if missing
+
+    Returns:
+        ProcessingConfig: Loaded and validated configuration
+
+    Raises:
+        ValueError: If configuration is invalid
+    """
+    # Layer the process environment over the environment file
+    env = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    env.update(os.environ)
+
+    # Create configuration from environment
+    config = ProcessingConfig(
+        # Required
+        api_key=env.get("GOOGLE_API_KEY", ""),
+
+        # API Configuration
+        model_name=env.get("MODEL_NAME", "gemini-2.0-flash"),
+        api_timeout=int(env.get("API_TIMEOUT", "120")),
+        max_retries=int(env.get("MAX_RETRIES", "3")),
+
+        # Processing Configuration
+        batch_size=int(env.get("BATCH_SIZE", "5")),
+        max_workers=int(env.get("MAX_WORKERS", "4")),
+        max_file_size_mb=int(env.get("MAX_FILE_SIZE_MB", "50")),
+
+        # Storage Configuration
+        hash_algorithm=env.get("HASH_ALGORITHM", "sha256"),
+        csv_chunk_size=int(env.get("CSV_CHUNK_SIZE", "100000")),
+        bloom_filter_threshold=int(env.get("BLOOM_FILTER_THRESHOLD", "1000000")),
+        bloom_filter_capacity=int(env.get("BLOOM_FILTER_CAPACITY", "10000000")),
+
+        # Directories
+        data_dir=env.get("DATA_DIR", "data"),
+        output_dir=env.get("OUTPUT_DIR", "output"),
+        output_filename=env.get("OUTPUT_FILENAME", "comprehensive_data.csv"),
+
+        # Logging
+        log_level=env.get("LOG_LEVEL", "INFO").upper(),
+        log_to_file=env.get("LOG_TO_FILE", "false").lower() == "true",
+        log_file_path=env.get("LOG_FILE_PATH"),
+    )
+
+    # Validate configuration
+    config.validate()
+
+    # Ensure directories exist
+    config.ensure_directories()
+
+    return config
+
+
 class ConfigManager:
     """Manages application configuration from multiple sources."""
 
@@ -104,47 +186,26 @@ class ConfigManager:
         Raises:
             ValueError: If configuration is invalid
         """
-        # Load environment variables
-        load_dotenv(self.env_file)
-
-        # Create configuration from environment
-        config = ProcessingConfig(
-            # Required
-            api_key=os.getenv("GOOGLE_API_KEY", ""),
-
-            # API Configuration
-            model_name=os.getenv("MODEL_NAME", "gemini-2.0-flash"),
-            api_timeout=int(os.getenv("API_TIMEOUT", "120")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-
-            # Processing Configuration
-            batch_size=int(os.getenv("BATCH_SIZE", "5")),
-            max_file_size_mb=int(os.getenv("MAX_FILE_SIZE_MB", "50")),
+        try:
+            env_file_mtime: Optional[float] = os.path.getmtime(self.env_file)
+        except OSError:
+            env_file_mtime = None
 
-            # Storage Configuration
-            hash_algorithm=os.getenv("HASH_ALGORITHM", "sha256"),
-            csv_chunk_size=int(os.getenv("CSV_CHUNK_SIZE", "1000")),
-
-            # Directories
-            data_dir=os.getenv("DATA_DIR", "data"),
-            output_dir=os.getenv("OUTPUT_DIR", "output"),
-            output_filename=os.getenv("OUTPUT_FILENAME", "comprehensive_data.csv"),
-
-            # Logging
-            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
-            log_to_file=os.getenv("LOG_TO_FILE", "false").lower() == "true",
-            log_file_path=os.getenv("LOG_FILE_PATH"),
-        )
-
-        # Validate configuration
-        config.validate()
-
-        # Ensure directories exist
-        config.ensure_directories()
+        config = _load_config_cached(self.env_file, env_file_mtime)
 
         self._config = config
         return config
 
+    def invalidate(self) -> None:
+        """
+        Discard cached configuration so the next load re-reads the environment.
+
+        Use this after changing environment variables in-process, which the
+        environment file mtime check cannot detect.
+        """
+        _load_config_cached.cache_clear()
+        self._config = None
+
     @property
     def config(self) -> ProcessingConfig:
         """
@@ -5,16 +5,102 @@ This module handles transaction deduplication, hashing, and CSV file operations
 for persistent storage of bank statement data.
 """
 
+import csv
+import functools
+import itertools
+import math
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import hashlib
 import os
-from typing import List, Set, Dict, Any
+from typing import Iterable, Iterator, List, Set, Dict, Any, Tuple, Union
 from src.schemas import Transaction, BankStatement
 
+# Column order of the transaction CSV
+CSV_COLUMNS = (
+    'transaction_hash', 'source_file', 'account_holder', 'bank_name',
+    'account_number', 'sort_code', 'statement_period', 'transaction_date',
+    'description', 'debit', 'credit', 'balance', 'reference'
+)
 
-def create_transaction_hash(account_number: str, transaction: Transaction) -> str:
+# Write buffer for CSV appends (1 MiB)
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Size in bytes of a transaction digest
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+# Output directories already created by append_to_csv in this process
+_created_directories: Set[str] = set()
+
+# ASCII characters str.strip() treats as whitespace; bytes.strip() alone
+# misses the \x1c-\x1f separators
+_ASCII_WHITESPACE = bytes(c for c in range(128) if chr(c).isspace())
+
+
+def _transaction_hash_input(account_number: bytes, transaction: Transaction) -> bytearray:
+    """
+    Build the byte string that identifies a transaction for hashing.
+
+    Args:
+        account_number: UTF-8 encoded account number
+        transaction: Transaction object to describe
+
+    Returns:
+        bytearray: Hash input, identical to the historical f-string encoding
+    """
+    # Normalize description for consistent hashing. ASCII text is
+    # normalized on its bytes directly; bytes.lower/strip only touch ASCII,
+    # so anything else keeps the str path to hash exactly as before.
+    description = transaction.description
+    if description.isascii():
+        normalized_description = description.encode('ascii').strip(_ASCII_WHITESPACE).lower()
+    else:
+        normalized_description = description.lower().strip().encode('utf-8')
+
+    # Handle None values for balance
+    balance = transaction.balance if transaction.balance is not None else 0.0
+
+    # Build the input in place; amounts always render as ASCII
+    buffer = bytearray(account_number)
+    buffer += b"-"
+    buffer += transaction.date.encode('utf-8')
+    buffer += b"-"
+    buffer += normalized_description
+    buffer += b"-"
+    buffer += str(transaction.debit).encode('ascii')
+    buffer += b"-"
+    buffer += str(transaction.credit).encode('ascii')
+    buffer += b"-"
+    buffer += str(balance).encode('ascii')
+
+    # Include reference if available
+    if transaction.reference:
+        buffer += b"-"
+        buffer += transaction.reference.encode('utf-8')
+
+    return buffer
+
+
+def create_transaction_hash(account_number: str, transaction: Transaction) -> bytes:
     """
-    Create a stable SHA-256 hash for transaction deduplication.
+    Create a stable SHA-256 digest for transaction deduplication.
+
+    Args:
+        account_number: Account number for the transaction
+        transaction: Transaction object to hash
+
+    Returns:
+        bytes: Raw 32-byte SHA-256 digest for the transaction
+    """
+    return create_transaction_hashes(account_number, [transaction])[0]
+
+
+def create_transaction_hash_hex(account_number: str, transaction: Transaction) -> str:
+    """
+    Create the hex form of a transaction hash, as stored in the CSV.
 
     Args:
         account_number: Account number for the transaction
@@ -23,44 +109,395 @@ def create_transaction_hash(account_number: str, transaction: Transaction) -> st
     Returns:
         str: SHA-256 hash string for the transaction
     """
-    # Normalize description for consistent hashing
-    normalized_description = transaction.description.lower().strip()
+    return create_transaction_hash(account_number, transaction).hex()
 
-    # Create hash string with all identifying information
-    # Handle None values for balance
-    balance_str = str(transaction.balance) if transaction.balance is not None else "0.0"
 
-    hash_string = (
-        f"{account_number}-{transaction.date}-{normalized_description}-"
-        f"{transaction.debit}-{transaction.credit}-{balance_str}"
+def create_transaction_hashes(account_number: str, transactions: List[Transaction]) -> List[bytes]:
+    """
+    Create SHA-256 digests for a batch of transactions from the same account.
+
+    The account number is encoded once and the hash inputs are built as
+    bytes, so the per-transaction cost is dominated by hashing itself.
+    Raw digests are returned because they are smaller and cheaper to look
+    up in a set than their hex strings.
+
+    Args:
+        account_number: Account number shared by the transactions
+        transactions: Transaction objects to hash
+
+    Returns:
+        List[bytes]: SHA-256 digests, in the same order as ``transactions``
+    """
+    sha256 = hashlib.sha256
+    account_bytes = account_number.encode('utf-8')
+
+    return [
+        sha256(_transaction_hash_input(account_bytes, transaction)).digest()
+        for transaction in transactions
+    ]
+
+
+def _iter_hash_chunks(csv_path: str, chunk_size: int) -> Iterator[pd.Series]:
+    """
+    Stream the transaction_hash column of a CSV file in chunks.
+
+    Args:
+        csv_path: Path to the CSV file
+        chunk_size: Number of rows to parse per chunk
+
+    Yields:
+        pd.Series: Non-null hex hash strings of each chunk; nothing if the
+            file has no transaction_hash column
+    """
+    # Parse only the hash column; a callable usecols tolerates files
+    # that lack it instead of raising
+    reader = pd.read_csv(
+        csv_path,
+        usecols=lambda column: column == 'transaction_hash',
+        dtype={'transaction_hash': 'string'},
+        engine='c',
+        chunksize=chunk_size,
     )
+    with reader:
+        for chunk in reader:
+            if 'transaction_hash' not in chunk.columns:
+                return
+            yield chunk['transaction_hash'].dropna()
 
-    # Include reference if available
-    if transaction.reference:
-        hash_string += f"-{transaction.reference}"
 
-    return hashlib.sha256(hash_string.encode('utf-8')).hexdigest()
+def _decode_hashes(hex_hashes: Iterable[str]) -> List[bytes]:
+    """
+    Decode stored hex hash strings, skipping malformed entries.
+
+    Each value is decoded on its own, so a single hand-edited cell costs
+    only its own row instead of the whole load.
 
+    Args:
+        hex_hashes: Hex hash strings as stored in the CSV
 
-def get_existing_hashes(csv_path: str) -> Set[str]:
+    Returns:
+        List[bytes]: Digests of the well-formed entries
+    """
+    digests = []
+    for tx_hash in hex_hashes:
+        try:
+            digest = bytes.fromhex(tx_hash)
+        except (TypeError, ValueError):
+            continue
+        if len(digest) == _DIGEST_SIZE:
+            digests.append(digest)
+    return digests
+
+
+def _hash_sidecar_path(csv_path: str) -> str:
+    """Path of the newline-delimited hash file kept next to a CSV file."""
+    return f"{csv_path}.hashes"
+
+
+def _hash_sidecar_is_current(csv_path: str) -> bool:
+    """Whether the hash sidecar exists and is at least as new as the CSV."""
+    try:
+        sidecar_mtime = os.stat(_hash_sidecar_path(csv_path)).st_mtime_ns
+        return sidecar_mtime >= os.stat(csv_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _remove_hash_sidecar(csv_path: str) -> None:
+    """Delete the hash sidecar so it is rebuilt from the CSV on next load."""
+    try:
+        os.remove(_hash_sidecar_path(csv_path))
+    except FileNotFoundError:
+        pass
+
+
+def _iter_sidecar_chunks(csv_path: str, chunk_size: int) -> Iterator[List[str]]:
+    """
+    Stream hex hashes from a CSV file's hash sidecar in chunks.
+
+    Args:
+        csv_path: Path to the CSV file the sidecar belongs to
+        chunk_size: Number of hashes per chunk
+
+    Yields:
+        List[str]: Hex hash strings
+    """
+    with open(_hash_sidecar_path(csv_path), encoding='ascii') as sidecar:
+        while True:
+            lines = list(itertools.islice(sidecar, chunk_size))
+            if not lines:
+                return
+            yield [line.rstrip('\n') for line in lines if line != '\n']
+
+
+def _iter_rebuilding_sidecar(csv_path: str, chunk_size: int) -> Iterator[List[bytes]]:
+    """
+    Stream digests from the CSV file while writing a fresh hash sidecar.
+
+    The sidecar only replaces the previous one once the whole CSV has been
+    read, so an interrupted read never leaves a partial sidecar behind.
+    Malformed hashes are left out of both the digests and the sidecar.
+
+    Args:
+        csv_path: Path to the CSV file
+        chunk_size: Number of rows to parse per chunk
+
+    Yields:
+        List[bytes]: Digests of each chunk
+    """
+    sidecar_path = _hash_sidecar_path(csv_path)
+    temp_path = f"{sidecar_path}.tmp"
+
+    try:
+        sidecar = open(temp_path, 'w', encoding='ascii')
+    except OSError:
+        # Output directory not writable; just read the CSV
+        sidecar = None
+
+    skipped = 0
+
+    try:
+        for chunk in _iter_hash_chunks(csv_path, chunk_size):
+            digests = _decode_hashes(chunk)
+            skipped += len(chunk) - len(digests)
+            if sidecar is not None:
+                sidecar.writelines(f"{digest.hex()}\n" for digest in digests)
+            yield digests
+        if sidecar is not None:
+            sidecar.close()
+            os.replace(temp_path, sidecar_path)
+    finally:
+        if sidecar is not None:
+            sidecar.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    if skipped:
+        print(f"Warning: Skipped {skipped} invalid transaction hashes in {csv_path}")
+
+
+def _iter_stored_hash_chunks(csv_path: str, chunk_size: int) -> Iterator[Iterable[str]]:
+    """
+    Stream stored hex hashes, from the sidecar when it is current.
+
+    Args:
+        csv_path: Path to the CSV file
+        chunk_size: Number of hashes to read per chunk
+
+    Returns:
+        Iterator: Chunks of hex hash strings
+    """
+    if _hash_sidecar_is_current(csv_path):
+        return _iter_sidecar_chunks(csv_path, chunk_size)
+    return _iter_hash_chunks(csv_path, chunk_size)
+
+
+class BloomHashSet:
+    """
+    Approximate set of transaction digests backed by a Bloom filter.
+
+    Used instead of an exact set once the transaction history is large:
+    it needs a few bytes per transaction instead of roughly a hundred.
+    Membership tests can return false positives but never false
+    negatives, so ``confirm`` resolves hits exactly before a transaction
+    is treated as a duplicate. Digests added after loading (not yet
+    written to the CSV) are also kept exactly, as they cannot be
+    confirmed from disk.
+    """
+
+    def __init__(
+        self,
+        csv_path: str,
+        capacity: int,
+        error_rate: float = 1e-6,
+        chunk_size: int = 100_000,
+    ):
+        """
+        Initialize an empty filter.
+
+        Args:
+            csv_path: CSV file the loaded digests come from
+            capacity: Expected number of digests
+            error_rate: Target false positive rate at capacity
+            chunk_size: Number of rows to parse per chunk when confirming
+        """
+        self.csv_path = csv_path
+        self.chunk_size = chunk_size
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self._count = 0
+        self._pending: Set[bytes] = set()
+
+    def _positions(self, digests: List[bytes]) -> np.ndarray:
+        """Bit positions of each digest, shape (len(digests), num_hashes)."""
+        # SHA-256 output is already uniform, so two 64-bit words of the
+        # digest serve directly as the double-hashing seeds
+        words = np.frombuffer(b"".join(digests), dtype='<u8').reshape(-1, 4)
+        first = words[:, 0:1]
+        step = words[:, 1:2] | np.uint64(1)
+        rounds = np.arange(self.num_hashes, dtype=np.uint64)
+        return (first + rounds * step) % np.uint64(self.num_bits)
+
+    def _set_bits(self, digests: List[bytes]) -> None:
+        """Set the filter bits for digests."""
+        # Positions take num_hashes words per digest, so bound the
+        # temporaries by working through chunk_size digests at a time
+        for start in range(0, len(digests), self.chunk_size):
+            batch = digests[start:start + self.chunk_size]
+            positions = self._positions(batch).ravel()
+            masks = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+            np.bitwise_or.at(self._bits, positions >> np.uint64(3), masks)
+            self._count += len(batch)
+
+    def _test_bits(self, digests: List[bytes]) -> np.ndarray:
+        """Whether all filter bits are set, per digest."""
+        hits = np.zeros(len(digests), dtype=bool)
+        for start in range(0, len(digests), self.chunk_size):
+            positions = self._positions(digests[start:start + self.chunk_size])
+            shifts = (positions & np.uint64(7)).astype(np.uint8)
+            hits[start:start + len(positions)] = (
+                (self._bits[positions >> np.uint64(3)] >> shifts) & 1
+            ).all(axis=1)
+        return hits
+
+    def load(self, digests: Iterable[bytes]) -> None:
+        """
+        Add digests that are already stored in the CSV file.
+
+        Args:
+            digests: Transaction digests
+        """
+        digests = iter(digests)
+        while True:
+            batch = list(itertools.islice(digests, self.chunk_size))
+            if not batch:
+                return
+            self._set_bits(batch)
+
+    def add(self, digest: bytes) -> None:
+        """
+        Add a digest that is not yet stored in the CSV file.
+
+        Args:
+            digest: Transaction digest
+        """
+        self.update([digest])
+
+    def update(self, digests: Iterable[bytes]) -> None:
+        """
+        Add digests that are not yet stored in the CSV file.
+
+        Args:
+            digests: Transaction digests
+        """
+        digests = list(digests)
+        self._set_bits(digests)
+        self._pending.update(digests)
+
+    def __ior__(self, digests: Iterable[bytes]) -> "BloomHashSet":
+        self.update(digests)
+        return self
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Whether the digest may be present (false positives possible)."""
+        return digest in self._pending or bool(self._test_bits([digest])[0])
+
+    def __len__(self) -> int:
+        """Number of digests added to the filter."""
+        return self._count
+
+    def confirm(self, digests: List[bytes]) -> Set[bytes]:
+        """
+        Determine exactly which digests are present.
+
+        Filter hits are checked against the pending digests and then with a
+        single pass over the stored hashes.
+
+        Args:
+            digests: Transaction digests to look up
+
+        Returns:
+            Set[bytes]: The digests that are definitely present
+        """
+        if not digests:
+            return set()
+
+        present = set()
+        candidates = set()
+        for digest, hit in zip(digests, self._test_bits(digests)):
+            if digest in self._pending:
+                present.add(digest)
+            elif hit:
+                candidates.add(digest)
+
+        if candidates:
+            for chunk in _iter_stored_hash_chunks(self.csv_path, self.chunk_size):
+                found = candidates.intersection(_decode_hashes(chunk))
+                present.update(found)
+                candidates -= found
+                if not candidates:
+                    break
+
+        return present
+
+
+def get_existing_hashes(
+    csv_path: str,
+    chunk_size: int = 100_000,
+    bloom_threshold: int = 0,
+    bloom_capacity: int = 10_000_000,
+) -> Union[Set[bytes], BloomHashSet]:
     """
     Read existing transaction hashes from CSV file.
 
+    The hashes are also kept in a ``.hashes`` sidecar file, one per line,
+    which is read instead of the CSV while it is at least as new as the
+    CSV; otherwise the CSV is read and the sidecar rebuilt. Either file is
+    streamed in chunks so memory use is bounded by the hash set itself
+    rather than by the size of the file. Once more than
+    ``bloom_threshold`` hashes have been read, the exact set is replaced
+    by a BloomHashSet to bound that as well. Malformed hashes, such as
+    hand-edited cells, are skipped rather than failing the whole load.
+
     Args:
         csv_path: Path to the CSV file
+        chunk_size: Number of rows to parse per chunk
+        bloom_threshold: Hash count above which to switch to a Bloom
+            filter; 0 always keeps the exact set
+        bloom_capacity: Expected number of hashes when using a Bloom filter
 
     Returns:
-        Set[str]: Set of existing transaction hashes
+        Union[Set[bytes], BloomHashSet]: Existing transaction digests
     """
     try:
         if not os.path.exists(csv_path):
+            _remove_hash_sidecar(csv_path)
             return set()
 
-        df = pd.read_csv(csv_path)
-        if 'transaction_hash' in df.columns:
-            return set(df['transaction_hash'].astype(str))
+        if _hash_sidecar_is_current(csv_path):
+            chunks = map(_decode_hashes, _iter_sidecar_chunks(csv_path, chunk_size))
         else:
-            return set()
+            chunks = _iter_rebuilding_sidecar(csv_path, chunk_size)
+
+        hashes: Union[Set[bytes], BloomHashSet] = set()
+
+        for digests in chunks:
+            if isinstance(hashes, BloomHashSet):
+                hashes.load(digests)
+                continue
+
+            hashes.update(digests)
+            if bloom_threshold and len(hashes) > bloom_threshold:
+                bloom = BloomHashSet(
+                    csv_path,
+                    capacity=max(bloom_capacity, len(hashes)),
+                    chunk_size=chunk_size,
+                )
+                bloom.load(hashes)
+                hashes = bloom
+
+        return hashes
 
     except (FileNotFoundError, pd.errors.EmptyDataError):
         return set()
@@ -69,32 +506,96 @@ def get_existing_hashes(csv_path: str) -> Set[str]:
         return set()
 
 
-def append_to_csv(records: List[Dict[str, Any]], csv_path: str) -> None:
+def resolve_existing_hashes(
+    existing_hashes: Union[Set[bytes], BloomHashSet],
+    statements: List[BankStatement],
+) -> Set[bytes]:
+    """
+    Resolve which of the statements' transactions are already stored.
+
+    With a Bloom filter, the filter hits of all statements are confirmed
+    together in a single pass over the stored hashes, rather than one pass
+    per statement during conversion. The result is an exact set that can
+    be passed to convert_statement_to_records and extended with its new
+    hashes. An exact set is returned unchanged.
+
+    Args:
+        existing_hashes: Existing transaction digests
+        statements: Statements about to be converted
+
+    Returns:
+        Set[bytes]: Existing transaction digests relevant to the statements
+    """
+    if not isinstance(existing_hashes, BloomHashSet):
+        return existing_hashes
+
+    tx_hashes = []
+    for statement in statements:
+        tx_hashes.extend(create_transaction_hashes(statement.account_number, statement.transactions))
+
+    return existing_hashes.confirm(tx_hashes)
+
+
+def _append_to_hash_sidecar(csv_path: str, hex_hashes: Iterable[str]) -> None:
+    """
+    Add newly written hashes to the CSV file's hash sidecar.
+
+    Args:
+        csv_path: Path to the CSV file
+        hex_hashes: Hex hash strings just appended to the CSV
+    """
+    try:
+        with open(_hash_sidecar_path(csv_path), 'a', encoding='ascii') as sidecar:
+            sidecar.writelines(f"{tx_hash}\n" for tx_hash in hex_hashes)
+    except OSError:
+        # A partial sidecar would hide hashes; force a rebuild instead
+        _remove_hash_sidecar(csv_path)
+
+
+def append_to_csv(records: pd.DataFrame, csv_path: str) -> None:
     """
     Append new transaction records to CSV file.
 
     Args:
-        records: List of transaction dictionaries to append
+        records: DataFrame of transaction records to append
         csv_path: Path to the CSV file
 
     Raises:
         Exception: If unable to write to CSV file
     """
-    if not records:
+    if records.empty:
         return
 
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-
-        # Create DataFrame from records
-        df = pd.DataFrame(records)
+        directory = os.path.dirname(csv_path)
+        if directory not in _created_directories:
+            os.makedirs(directory, exist_ok=True)
+            _created_directories.add(directory)
 
         # Check if file exists and has content
-        file_exists = os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
+        try:
+            file_exists = os.stat(csv_path).st_size > 0
+        except FileNotFoundError:
+            file_exists = False
+
+        # Missing values are written as empty cells, as pandas did
+        rows = records[list(CSV_COLUMNS)].astype(object)
+        rows = rows.where(rows.notna(), None)
+
+        # Only extend the hash sidecar if it matched the CSV beforehand
+        sidecar_current = _hash_sidecar_is_current(csv_path)
 
         # Write to CSV
-        df.to_csv(csv_path, mode='a', header=not file_exists, index=False)
+        with open(csv_path, 'a', newline='', encoding='utf-8',
+                  buffering=CSV_WRITE_BUFFER_SIZE) as csv_file:
+            writer = csv.writer(csv_file, lineterminator=os.linesep)
+            if not file_exists:
+                writer.writerow(CSV_COLUMNS)
+            writer.writerows(rows.itertuples(index=False, name=None))
+
+        if sidecar_current:
+            _append_to_hash_sidecar(csv_path, records['transaction_hash'])
 
         print(f"Successfully appended {len(records)} records to {csv_path}")
 
@@ -106,76 +607,130 @@ def append_to_csv(records: List[Dict[str, Any]], csv_path: str) -> None:
 def convert_statement_to_records(
     statement: BankStatement,
     source_filename: str,
-    existing_hashes: Set[str]
-) -> List[Dict[str, Any]]:
+    existing_hashes: Union[Set[bytes], BloomHashSet]
+) -> Tuple[pd.DataFrame, Set[bytes]]:
     """
     Convert BankStatement to CSV records, filtering out duplicates.
 
+    Records are collected column by column and handed to pandas in a
+    single constructor call, avoiding a dict per transaction.
+    ``existing_hashes`` is only read, so statements can be converted in
+    parallel and their new hashes merged by the caller afterwards.
+
     Args:
         statement: BankStatement object to convert
         source_filename: Name of source PDF file
-        existing_hashes: Set of existing transaction hashes
+        existing_hashes: Existing transaction digests
 
     Returns:
-        List[Dict]: List of new transaction records ready for CSV
+        Tuple[pd.DataFrame, Set[bytes]]: New transaction records ready for
+            CSV, and the digests of those records
     """
-    new_records = []
-
-    for transaction in statement.transactions:
-        # Create hash for this transaction
-        tx_hash = create_transaction_hash(statement.account_number, transaction)
+    # Statement-level values are the same for every record
+    header = {
+        'source_file': source_filename,
+        'account_holder': statement.account_holder_name,
+        'bank_name': statement.bank_name,
+        'account_number': statement.account_number,
+        'sort_code': statement.sort_code,
+        'statement_period': statement.statement_period,
+    }
 
+    # Columns are pre-sized to the statement and trimmed after dedup
+    n = len(statement.transactions)
+    hashes = [None] * n
+    dates = [None] * n
+    descriptions = [None] * n
+    debits = [None] * n
+    credits = [None] * n
+    balances = [None] * n
+    references = [None] * n
+    count = 0
+    new_hashes: Set[bytes] = set()
+
+    tx_hashes = create_transaction_hashes(statement.account_number, statement.transactions)
+
+    if isinstance(existing_hashes, BloomHashSet):
+        # Resolve possible false positives once for the whole statement
+        existing_hashes = existing_hashes.confirm(tx_hashes)
+
+    for tx_hash, transaction in zip(tx_hashes, statement.transactions):
         # Skip if already exists
-        if tx_hash in existing_hashes:
+        if tx_hash in existing_hashes or tx_hash in new_hashes:
             continue
 
-        # Create record dictionary
-        record = {
-            'transaction_hash': tx_hash,
-            'source_file': source_filename,
-            'account_holder': statement.account_holder_name,
-            'bank_name': statement.bank_name,
-            'account_number': statement.account_number,
-            'sort_code': statement.sort_code,
-            'statement_period': statement.statement_period,
-            'transaction_date': transaction.date,
-            'description': transaction.description,
-            'debit': transaction.debit,
-            'credit': transaction.credit,
-            'balance': transaction.balance,
-            'reference': transaction.reference,
-        }
-
-        new_records.append(record)
-        existing_hashes.add(tx_hash)  # Update set to prevent duplicates within same batch
-
-    return new_records
+        hashes[count] = tx_hash.hex()
+        dates[count] = transaction.date
+        descriptions[count] = transaction.description
+        debits[count] = transaction.debit
+        credits[count] = transaction.credit
+        balances[count] = transaction.balance
+        references[count] = transaction.reference
+        count += 1
+
+        new_hashes.add(tx_hash)  # Prevent duplicates within the same statement
+
+    if count < n:
+        for column in (hashes, dates, descriptions, debits, credits, balances, references):
+            del column[count:]
+
+    records = pd.DataFrame({
+        'transaction_hash': pd.Series(hashes, dtype='string'),
+        **{
+            column: pd.Series([value] * count, dtype='string')
+            for column, value in header.items()
+        },
+        'transaction_date': pd.Series(dates, dtype='string'),
+        'description': pd.Series(descriptions, dtype='string'),
+        'debit': pd.Series(debits, dtype='float64'),
+        'credit': pd.Series(credits, dtype='float64'),
+        'balance': pd.Series(balances, dtype='float64'),
+        'reference': pd.Series(references, dtype='string'),
+    })
+
+    return records, new_hashes
 
 
 def validate_csv_structure(csv_path: str) -> bool:
     """
     Validate that CSV file has the expected column structure.
 
+    The result is memoized per file modification time, so repeated checks
+    of an unchanged file skip re-reading its header.
+
     Args:
         csv_path: Path to CSV file to validate
 
     Returns:
         bool: True if structure is valid, False otherwise
     """
-    expected_columns = {
-        'transaction_hash', 'source_file', 'account_holder', 'bank_name',
-        'account_number', 'sort_code', 'statement_period', 'transaction_date',
-        'description', 'debit', 'credit', 'balance', 'reference'
-    }
-
     try:
-        if not os.path.exists(csv_path):
-            return True  # New file is okay
+        mtime = os.path.getmtime(csv_path)
+    except FileNotFoundError:
+        return True  # New file is okay
+    except OSError:
+        return False
+
+    return _validate_csv_structure_cached(csv_path, mtime)
+
 
+@functools.lru_cache(maxsize=16)
+def _validate_csv_structure_cached(csv_path: str, mtime: float) -> bool:
+    """
+    Check the CSV header for the expected columns.
+
+    Args:
+        csv_path: Path to CSV file to validate
+        mtime: Modification time of the file, used as part of the cache key
+
+    Returns:
+        bool: True if structure is valid, False otherwise
+    """
+    try:
         df = pd.read_csv(csv_path, nrows=0)  # Read only headers
         actual_columns = set(df.columns)
 
-        return expected_columns.issubset(actual_columns)
+        return set(CSV_COLUMNS).issubset(actual_columns)
 
     except Exception:
         return False
@@ -195,15 +750,29 @@ def get_csv_summary(csv_path: str) -> Dict[str, Any]:
         if not os.path.exists(csv_path):
             return {"total_transactions": 0, "unique_accounts": 0, "banks": []}
 
-        df = pd.read_csv(csv_path)
+        # Parse only the summarised columns, multi-threaded, as strings so
+        # dates are reported exactly as stored. Descriptions may hold quoted
+        # line breaks, which the parser must expect at block boundaries.
+        summary_columns = ['account_number', 'bank_name', 'transaction_date']
+        table = pacsv.read_csv(
+            csv_path,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={column: pa.string() for column in summary_columns},
+                include_columns=summary_columns,
+                include_missing_columns=True,
+                strings_can_be_null=True,
+            ),
+        )
+        date_range = pc.min_max(table['transaction_date'])
 
         summary = {
-            "total_transactions": len(df),
-            "unique_accounts": df['account_number'].nunique() if 'account_number' in df.columns else 0,
-            "banks": df['bank_name'].unique().tolist() if 'bank_name' in df.columns else [],
+            "total_transactions": table.num_rows,
+            "unique_accounts": pc.count_distinct(table['account_number']).as_py(),
+            "banks": pc.unique(pc.drop_null(table['bank_name'])).to_pylist(),
             "date_range": {
-                "earliest": df['transaction_date'].min() if 'transaction_date' in df.columns else None,
-                "latest": df['transaction_date'].max() if 'transaction_date' in df.columns else None
+                "earliest": date_range['min'].as_py(),
+                "latest": date_range['max'].as_py()
             }
         }
 
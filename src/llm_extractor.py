@@ -6,23 +6,19 @@ structured bank statement data from raw text.
 """
 
 from google import genai
-import json
+import asyncio
+import functools
+import orjson
 import re
-from typing import Optional
+from typing import List, Optional, Union
 from src.schemas import BankStatement
 
+# Markdown code fences the model sometimes wraps its JSON in
+_CODE_FENCE_OPEN = re.compile(r'^```json\s*', re.MULTILINE)
+_CODE_FENCE_CLOSE = re.compile(r'^```\s*$', re.MULTILINE)
 
-def build_prompt(text: str) -> str:
-    """
-    Build a detailed prompt for the LLM to extract bank statement data.
-
-    Args:
-        text: Raw text extracted from PDF
-
-    Returns:
-        str: Formatted prompt for the AI model
-    """
-    return f"""You are an expert financial data extraction assistant. Your task is to extract structured information from bank statement text and return it as valid JSON.
+# Static parts of the extraction prompt, either side of the statement text
+_PROMPT_HEAD = """You are an expert financial data extraction assistant. Your task is to extract structured information from bank statement text and return it as valid JSON.
 
 CRITICAL REQUIREMENTS:
 1. Extract ALL transactions found in the statement
@@ -32,23 +28,23 @@ CRITICAL REQUIREMENTS:
 5. Return ONLY valid JSON, no markdown formatting
 
 JSON STRUCTURE REQUIRED:
-{{
+{
     "account_holder_name": "Full name of account holder",
     "bank_name": "Bank name (e.g., HSBC, Barclays, Santander)",
     "account_number": "Account number",
     "sort_code": "Sort code (XX-XX-XX format)",
     "statement_period": "Statement period (e.g., 'January 2024')",
     "transactions": [
-        {{
+        {
             "date": "YYYY-MM-DD",
             "description": "Transaction description",
             "debit": 123.45 or null,
             "credit": 67.89 or null,
             "balance": 1234.56,
             "reference": "Reference number or null"
-        }}
+        }
     ]
-}}
+}
 
 IMPORTANT NOTES:
 - If amount is a debit/withdrawal, put value in "debit" field and null in "credit"
@@ -60,12 +56,45 @@ IMPORTANT NOTES:
 
 Here is the bank statement text to process:
 ---
-{text}
+"""
+
+_PROMPT_TAIL = """
 ---
 
 Return only the JSON response:"""
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> genai.Client:
+    """
+    Get a shared Gemini client for an API key.
+
+    Reusing the client keeps its HTTP connection pool, so consecutive
+    requests skip the TCP and TLS handshakes. The client's underlying
+    httpx clients are safe to share between threads.
+
+    Args:
+        api_key: Google API key for Gemini
+
+    Returns:
+        genai.Client: Cached client for the key
+    """
+    return genai.Client(api_key=api_key)
+
+
+def build_prompt(text: str) -> str:
+    """
+    Build a detailed prompt for the LLM to extract bank statement data.
+
+    Args:
+        text: Raw text extracted from PDF
+
+    Returns:
+        str: Formatted prompt for the AI model
+    """
+    return _PROMPT_HEAD + text + _PROMPT_TAIL
+
+
 def extract_data_with_llm(text: str, api_key: str) -> BankStatement:
     """
     Send text to the LLM and parse response into BankStatement object.
@@ -79,14 +108,14 @@ def extract_data_with_llm(text: str, api_key: str) -> BankStatement:
 
     Raises:
         ValueError: If API key is invalid
-        json.JSONDecodeError: If LLM response is not valid JSON
+        orjson.JSONDecodeError: If LLM response is not valid JSON
         Exception: If data validation fails
     """
     if not api_key:
         raise ValueError("Google API key is required")
 
     # Configure the API with new SDK
-    client = genai.Client(api_key=api_key)
+    client = _get_client(api_key)
 
     # Build and send prompt
     prompt = build_prompt(text)
@@ -96,7 +125,110 @@ def extract_data_with_llm(text: str, api_key: str) -> BankStatement:
             model='gemini-2.0-flash',
             contents=prompt
         )
+    except Exception as e:
+        print(f"Error during AI extraction: {e}")
+        raise
+
+    return _parse_statement_response(response)
+
+
+async def extract_data_with_llm_async(
+    text: str,
+    api_key: str,
+    client: Optional[genai.Client] = None,
+) -> BankStatement:
+    """
+    Asynchronously send text to the LLM and parse the BankStatement response.
+
+    Args:
+        text: Raw text from PDF
+        api_key: Google API key for Gemini
+        client: Client to send the request with; the shared client if not given
+
+    Returns:
+        BankStatement: Validated bank statement data
+
+    Raises:
+        ValueError: If API key is invalid
+        orjson.JSONDecodeError: If LLM response is not valid JSON
+        Exception: If data validation fails
+    """
+    if not api_key:
+        raise ValueError("Google API key is required")
+
+    if client is None:
+        client = _get_client(api_key)
+
+    # Build and send prompt
+    prompt = build_prompt(text)
+
+    try:
+        response = await client.aio.models.generate_content(
+            model='gemini-2.0-flash',
+            contents=prompt
+        )
+    except Exception as e:
+        print(f"Error during AI extraction: {e}")
+        raise
+
+    return _parse_statement_response(response)
+
+
+async def extract_many(
+    texts: List[str],
+    api_key: str,
+    concurrency: int = 5,
+) -> List[Union[BankStatement, Exception]]:
+    """
+    Extract several statements concurrently over a single client.
+
+    The requests are network-bound, so overlapping them scales close to
+    linearly until the API rate limit; the semaphore keeps at most
+    ``concurrency`` requests in flight.
+
+    Args:
+        texts: Raw texts from PDFs
+        api_key: Google API key for Gemini
+        concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        List: BankStatement for each text, or the exception raised for it,
+            in the same order as ``texts``
 
+    Raises:
+        ValueError: If API key is invalid
+    """
+    if not api_key:
+        raise ValueError("Google API key is required")
+
+    client = _get_client(api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract(text: str) -> BankStatement:
+        async with semaphore:
+            return await extract_data_with_llm_async(text, api_key, client=client)
+
+    return await asyncio.gather(
+        *(_extract(text) for text in texts),
+        return_exceptions=True
+    )
+
+
+def _parse_statement_response(response) -> BankStatement:
+    """
+    Parse a model response into a BankStatement object.
+
+    Args:
+        response: Response returned by the Gemini SDK
+
+    Returns:
+        BankStatement: Validated bank statement data
+
+    Raises:
+        orjson.JSONDecodeError: If LLM response is not valid JSON
+        Exception: If data validation fails
+    """
+    try:
         if not response.text:
             raise Exception("Empty response from AI model")
 
@@ -104,12 +236,12 @@ def extract_data_with_llm(text: str, api_key: str) -> BankStatement:
         json_text = _clean_json_response(response.text)
 
         # Parse JSON
-        data = json.loads(json_text)
+        data = orjson.loads(json_text)
 
         # Validate and return as BankStatement
-        return BankStatement(**data)
+        return BankStatement.model_validate(data)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Failed to parse LLM response as JSON: {e}")
         print(f"Raw response: {response.text[:500]}...")
         raise
@@ -128,11 +260,17 @@ def _clean_json_response(response_text: str) -> str:
     Returns:
         str: Cleaned JSON string
     """
-    # Remove markdown code blocks
     text = response_text.strip()
-    text = re.sub(r'^```json\s*', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^```\s*$', '', text, flags=re.MULTILINE)
-    text = text.strip()
+
+    # Fast path: the model usually returns bare JSON
+    if text.startswith('{') and text.endswith('}'):
+        return text
+
+    # Remove markdown code blocks
+    if '```' in text:
+        text = _CODE_FENCE_OPEN.sub('', text)
+        text = _CODE_FENCE_CLOSE.sub('', text)
+        text = text.strip()
 
     # Find JSON boundaries
     start_idx = text.find('{')
@@ -155,7 +293,7 @@ def test_api_connection(api_key: str) -> bool:
         bool: True if connection successful, False otherwise
     """
     try:
-        client = genai.Client(api_key=api_key)
+        client = _get_client(api_key)
         response = client.models.generate_content(
             model='gemini-2.0-flash',
             contents="Say 'API connection successful'"
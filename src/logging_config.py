@@ -5,12 +5,61 @@ This module sets up structured logging using structlog with consistent
 formatting and appropriate log levels.
 """
 
+import functools
+import json
 import logging
+import os
+import socket
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 
+from src.exceptions import StatementProcessingError
+
+# Process-wide values attached to every log event, computed once
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson for structlog's JSONRenderer.
+
+    orjson writes NaN and infinities as null. Events it cannot encode, such
+    as integers beyond 64 bits, are serialized with the json module instead.
+
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: Renderer options; only ``default`` is used
+
+    Returns:
+        str: JSON encoded event
+    """
+    default = kwargs.get("default")
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except TypeError:
+        return json.dumps(obj, default=default)
+
+
+def _add_static_context(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the host name and process id to a log event.
+
+    Args:
+        logger: Wrapped logger
+        method_name: Name of the logging method called
+        event_dict: Event dictionary being processed
+
+    Returns:
+        Dict[str, Any]: The event dictionary
+    """
+    event_dict.setdefault("host", _HOSTNAME)
+    event_dict.setdefault("pid", _PID)
+    return event_dict
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
@@ -35,12 +84,11 @@ def setup_logging(level: str = "INFO") -> None:
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
+            _add_static_context,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -49,10 +97,14 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a structured logger instance.
 
+    Loggers are memoized per name, so repeated lookups skip structlog's
+    logger factory dispatch.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -69,8 +121,28 @@ class LoggerMixin:
 
     @property
     def logger(self) -> structlog.stdlib.BoundLogger:
-        """Get a logger instance for this class."""
-        return get_logger(self.__class__.__module__)
+        """Get a logger instance for this class, cached on first access."""
+        logger = self.__dict__.get("_logger")
+        if logger is None:
+            logger = get_logger(self.__class__.__module__)
+            self.__dict__["_logger"] = logger
+        return logger
+
+    def _logs_at(self, level: int) -> bool:
+        """
+        Whether the logger emits events at the given level.
+
+        Before setup_logging() configures the stdlib integration, structlog's
+        default logger has no level check, so everything is assumed enabled.
+
+        Args:
+            level: Standard library logging level
+
+        Returns:
+            bool: False only if events at the level are known to be dropped
+        """
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        return is_enabled_for is None or is_enabled_for(level)
 
     def log_operation(self, operation: str, **kwargs: Any) -> None:
         """
@@ -80,23 +152,40 @@ class LoggerMixin:
             operation: Operation description
             **kwargs: Additional structured data
         """
+        if not self._logs_at(logging.INFO):
+            return
+
         self.logger.info(operation, **kwargs)
 
-    def log_error(self, error: str, exception: Exception = None, **kwargs: Any) -> None:
+    def log_error(
+        self,
+        error: str,
+        exception: Exception = None,
+        event: str = "Operation failed",
+        **kwargs: Any
+    ) -> None:
         """
         Log an error with structured data.
 
         Args:
             error: Error description
-            exception: Exception instance if available
+            exception: Exception instance if available; a
+                StatementProcessingError is logged via its to_dict()
+            event: Event name to log under
             **kwargs: Additional structured data
         """
+        if not self._logs_at(logging.ERROR):
+            return
+
         log_data = {"error": error, **kwargs}
-        if exception:
+        if isinstance(exception, StatementProcessingError):
+            # Structured errors already carry their own serialized form
+            log_data.update(exception.to_dict())
+        elif exception:
             log_data["exception_type"] = type(exception).__name__
             log_data["exception_message"] = str(exception)
 
-        self.logger.error("Operation failed", **log_data)
+        self.logger.error(event, **log_data)
 
     def log_progress(self, current: int, total: int, item: str = None, **kwargs: Any) -> None:
         """
@@ -108,6 +197,10 @@ class LoggerMixin:
             item: Current item description
             **kwargs: Additional structured data
         """
+        # Skip building the payload when INFO is filtered out
+        if not self._logs_at(logging.INFO):
+            return
+
         progress_data = {
             "progress_current": current,
             "progress_total": total,
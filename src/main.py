@@ -5,10 +5,14 @@ This module orchestrates the entire processing pipeline:
 PDF extraction -> AI analysis -> Data validation -> CSV storage
 """
 
+import importlib.util
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import pandas as pd
 
 # Suppress urllib3 OpenSSL warning
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL 1.1.1+.*")
@@ -19,13 +23,13 @@ from src.exceptions import (
     StatementProcessingError,
     ConfigurationError,
     PDFProcessingError,
+    PDFValidationError,
     AIProcessingError,
     StorageError
 )
-from src.pdf_parser import extract_text_from_pdf, validate_pdf_file
-from src.llm_extractor import extract_data_with_llm, test_api_connection
 from src.data_processor import (
     get_existing_hashes,
+    resolve_existing_hashes,
     convert_statement_to_records,
     append_to_csv,
     get_csv_summary,
@@ -33,6 +37,22 @@ from src.data_processor import (
 )
 
 
+def _module_available(name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    Args:
+        name: Dotted module name
+
+    Returns:
+        bool: True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False  # Parent package is missing
+
+
 class StatementProcessor(LoggerMixin):
     """Main application class for processing bank statements."""
 
@@ -55,7 +75,21 @@ class StatementProcessor(LoggerMixin):
         """
         self.logger.info("Setting up application environment")
 
+        # Fail fast on missing dependencies; the heavy modules themselves
+        # are only imported once they are needed
+        missing_modules = [
+            module for module in ("fitz", "google.genai")
+            if not _module_available(module)
+        ]
+        if missing_modules:
+            raise ConfigurationError(
+                "Required dependencies are not installed",
+                details={"missing_modules": missing_modules}
+            )
+
         try:
+            from src.llm_extractor import test_api_connection
+
             # Test API connection
             self.log_operation("Testing API connection")
             if not test_api_connection(self.config.api_key):
@@ -81,8 +115,11 @@ class StatementProcessor(LoggerMixin):
         """
         Get list of PDF files in the configured directory.
 
+        Files are not opened here; invalid PDFs are reported when they
+        are processed, so each file is only opened once.
+
         Returns:
-            List[str]: List of valid PDF file paths
+            List[str]: List of PDF file paths
         """
         pdf_directory = Path(self.config.data_dir)
 
@@ -91,50 +128,51 @@ class StatementProcessor(LoggerMixin):
             pdf_directory.mkdir(parents=True, exist_ok=True)
             return []
 
-        pdf_files = []
-        invalid_files = []
-
-        for file_path in pdf_directory.glob("*.pdf"):
-            if validate_pdf_file(str(file_path)):
-                pdf_files.append(str(file_path))
-            else:
-                invalid_files.append(file_path.name)
-
-        if invalid_files:
-            self.logger.warning(
-                "Found invalid PDF files",
-                invalid_count=len(invalid_files),
-                invalid_files=invalid_files
-            )
+        allowed_extensions = {extension.lower() for extension in self.config.allowed_extensions}
+        pdf_files = [
+            str(file_path)
+            for file_path in pdf_directory.iterdir()
+            if file_path.suffix.lower() in allowed_extensions and file_path.is_file()
+        ]
 
         self.log_operation(
             "PDF file discovery completed",
-            valid_files=len(pdf_files),
-            invalid_files=len(invalid_files),
+            file_count=len(pdf_files),
             directory=str(pdf_directory)
         )
 
         return sorted(pdf_files)
 
 
-    def process_single_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def process_single_pdf(self, pdf_path: str, filename: Optional[str] = None) -> Dict[str, Any]:
         """
         Process a single PDF file and extract bank statement data.
 
         Args:
             pdf_path: Path to PDF file
+            filename: Precomputed display name; derived from pdf_path if omitted
 
         Returns:
             dict: Processing result with status and data/error info
         """
-        filename = Path(pdf_path).name
+        # Imported here so PyMuPDF and the Gemini SDK load only when needed
+        from src.pdf_parser import open_and_extract
+        from src.llm_extractor import extract_data_with_llm
+
+        filename = filename or Path(pdf_path).name
 
         self.log_operation("Starting PDF processing", filename=filename, path=pdf_path)
 
         try:
             # Extract text from PDF
             self.log_operation("Extracting text from PDF", filename=filename)
-            raw_text = extract_text_from_pdf(pdf_path)
+            raw_text = open_and_extract(pdf_path)
+
+            if raw_text is None:
+                raise PDFValidationError(
+                    "File is not a readable PDF",
+                    file_path=pdf_path
+                )
 
             if not raw_text or len(raw_text.strip()) < 50:
                 raise PDFProcessingError(
@@ -169,13 +207,13 @@ class StatementProcessor(LoggerMixin):
             }
 
         except Exception as e:
-            error_data = {"filename": filename, "path": pdf_path}
-
-            if isinstance(e, StatementProcessingError):
-                error_data.update(e.to_dict())
-                self.logger.error("PDF processing failed", **error_data)
-            else:
-                self.log_error("Unexpected error during PDF processing", e, **error_data)
+            self.log_error(
+                "PDF processing failed",
+                e,
+                event="PDF processing failed",
+                filename=filename,
+                path=pdf_path,
+            )
 
             return {
                 "status": "error",
@@ -203,15 +241,22 @@ def main():
         # Setup environment and validate API
         processor.setup_environment()
 
+        out_path = Path(config.output_path)
+
         # Validate CSV structure
         if not validate_csv_structure(config.output_path):
             logger.warning("Existing CSV has invalid structure, creating backup")
             backup_path = f"{config.output_path}.backup"
-            if Path(config.output_path).exists():
-                Path(config.output_path).rename(backup_path)
+            if out_path.exists():
+                out_path.rename(backup_path)
 
         # Get existing transactions
-        existing_hashes = get_existing_hashes(config.output_path)
+        existing_hashes = get_existing_hashes(
+            config.output_path,
+            config.csv_chunk_size,
+            bloom_threshold=config.bloom_filter_threshold,
+            bloom_capacity=config.bloom_filter_capacity,
+        )
         logger.info("Existing transactions loaded", count=len(existing_hashes))
 
         # Get PDF files to process
@@ -223,27 +268,50 @@ def main():
             print("Please add PDF bank statements to process.")
             return
 
-        logger.info("Starting batch processing", file_count=len(pdf_files))
+        total = len(pdf_files)
+        names = {pdf_path: Path(pdf_path).name for pdf_path in pdf_files}
+        logger.info("Starting batch processing", file_count=total)
+
+        # Process PDF files concurrently; each file is independent and
+        # dominated by waiting on the LLM, so threads overlap that wait.
+        # Text extraction itself is serialized inside pdf_parser.
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            futures = {
+                executor.submit(processor.process_single_pdf, pdf_path, names[pdf_path]): pdf_path
+                for pdf_path in pdf_files
+            }
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    processor.log_progress(i, total, item=names[futures[future]])
+            except KeyboardInterrupt:
+                # Finish only the files already in progress, not the queue
+                executor.shutdown(cancel_futures=True)
+                raise
+
+            # Collect in file order so deduplication is deterministic
+            results = [future.result() for future in futures]
+
+        # Look up all statements' transactions in the history at once
+        existing_hashes = resolve_existing_hashes(
+            existing_hashes,
+            [result["statement"] for result in results if result["status"] == "success"],
+        )
 
-        # Process each PDF file
-        all_new_records = []
+        new_record_frames = []
         successful_files = 0
         failed_files = []
 
-        for i, pdf_path in enumerate(pdf_files, 1):
-            processor.log_progress(i, len(pdf_files), item=Path(pdf_path).name)
-
-            result = processor.process_single_pdf(pdf_path)
-
+        for result in results:
             if result["status"] == "success":
                 # Convert to CSV records
-                new_records = convert_statement_to_records(
+                new_records, new_hashes = convert_statement_to_records(
                     result["statement"],
                     result["filename"],
                     existing_hashes
                 )
+                existing_hashes |= new_hashes
 
-                all_new_records.extend(new_records)
+                new_record_frames.append(new_records)
                 successful_files += 1
 
                 logger.info(
@@ -260,8 +328,13 @@ def main():
                     "error_type": result.get("error_type", "Unknown")
                 })
 
+        all_new_records = (
+            pd.concat(new_record_frames, ignore_index=True)
+            if new_record_frames else pd.DataFrame()
+        )
+
         # Save new records to CSV
-        if all_new_records:
+        if not all_new_records.empty:
             logger.info("Saving new transactions", count=len(all_new_records))
             try:
                 append_to_csv(all_new_records, config.output_path)
@@ -279,7 +352,7 @@ def main():
         # Generate and log summary
         summary_data = {
             "files_processed": successful_files,
-            "total_files": len(pdf_files),
+            "total_files": total,
             "new_transactions": len(all_new_records),
             "failed_files": len(failed_files)
         }
@@ -290,7 +363,7 @@ def main():
         print("\n" + "=" * 50)
         print("📈 PROCESSING SUMMARY")
         print("=" * 50)
-        print(f"Files processed successfully: {successful_files}/{len(pdf_files)}")
+        print(f"Files processed successfully: {successful_files}/{total}")
         print(f"New transactions added: {len(all_new_records)}")
 
         if failed_files:
@@ -5,38 +5,83 @@ This module provides functionality to extract text content from PDF files
 using PyMuPDF (fitz) library.
 """
 
+import mmap
+import threading
 import fitz  # PyMuPDF
 from typing import Optional
 
+# Default text flags without ligature and whitespace preservation, so
+# ligatures come out as plain letters and special whitespace as spaces.
+# Mediabox clipping is kept to avoid picking up off-page text.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~(fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE)
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+# PyMuPDF does not support being used from several threads at once, so
+# every use of it in this module is serialized behind this lock
+_MUPDF_LOCK = threading.Lock()
+
+
+def open_and_extract(pdf_path: str) -> Optional[str]:
     """
-    Extract all text from a PDF file.
+    Validate a PDF file and extract all of its text in a single open.
 
     Args:
         pdf_path: Path to the PDF file to process
 
     Returns:
-        str: Extracted text content from all pages
-
-    Raises:
-        Exception: If PDF cannot be opened or processed
+        Optional[str]: Extracted text content from all pages, or None if the
+            file is not a readable PDF with at least one page
     """
     try:
-        doc = fitz.open(pdf_path)
-        text = ""
+        with open(pdf_path, "rb") as pdf_file:
+            mapped = mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception as e:
+        print(f"Error reading {pdf_path}: {e}")
+        return None
 
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text += page.get_text()
-            text += "\n"  # Add page separator
+    # MuPDF reads directly from the memory map, so only the pages it
+    # touches are paged in; fitz takes a memoryview without copying it
+    view = memoryview(mapped)
+    doc = None
 
-        doc.close()
-        return text.strip()
+    with _MUPDF_LOCK:
+        try:
+            doc = fitz.open(stream=view, filetype="pdf")
 
-    except Exception as e:
-        print(f"Error reading {pdf_path}: {e}")
-        return ""
+            if len(doc) == 0:
+                return None
+
+            parts = []
+
+            for page in doc:
+                parts.append(page.get_text("text", flags=_TEXT_FLAGS))
+                parts.append("\n")  # Add page separator
+
+            return "".join(parts).strip()
+
+        except Exception as e:
+            print(f"Error reading {pdf_path}: {e}")
+            return None
+
+        finally:
+            if doc is not None:
+                doc.close()
+            view.release()
+            mapped.close()
+
+
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """
+    Extract all text from a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file to process
+
+    Returns:
+        str: Extracted text content from all pages, empty if the file
+            cannot be read
+    """
+    text = open_and_extract(pdf_path)
+    return text if text is not None else ""
 
 
 def validate_pdf_file(pdf_path: str) -> bool:
@@ -50,9 +95,10 @@ def validate_pdf_file(pdf_path: str) -> bool:
         bool: True if file is a valid PDF, False otherwise
     """
     try:
-        doc = fitz.open(pdf_path)
-        page_count = len(doc)
-        doc.close()
+        with _MUPDF_LOCK:
+            doc = fitz.open(pdf_path)
+            page_count = len(doc)
+            doc.close()
         return page_count > 0
     except Exception:
         return False
\ No newline at end of file
@@ -5,12 +5,14 @@ This module defines the Pydantic models that ensure all extracted data
 is properly validated and structured.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 
 class Transaction(BaseModel):
     """Represents a single bank transaction."""
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(..., description="Transaction date in YYYY-MM-DD format")
     description: str = Field(..., description="Transaction description")
     debit: Optional[float] = Field(None, description="Debit amount if applicable")
@@ -21,6 +23,8 @@ class Transaction(BaseModel):
 
 class BankStatement(BaseModel):
     """Represents a complete bank statement with metadata and transactions."""
+    model_config = ConfigDict(frozen=True)
+
     account_holder_name: str = Field(..., description="Name of account holder")
     bank_name: str = Field(..., description="Name of the bank")
     account_number: str = Field(..., description="Account number")
@@ -0,0 +1,35 @@
+"""
+Tests for configuration loading.
+"""
+
+import os
+
+from src.config import ConfigManager
+
+
+def test_env_file_edits_are_picked_up(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("BATCH_SIZE", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("GOOGLE_API_KEY=test-key\nBATCH_SIZE=5\n")
+    manager = ConfigManager(str(env_file))
+
+    assert manager.load_config().batch_size == 5
+
+    env_file.write_text("GOOGLE_API_KEY=test-key\nBATCH_SIZE=9\n")
+    mtime = os.path.getmtime(env_file) + 10
+    os.utime(env_file, (mtime, mtime))
+
+    assert manager.load_config().batch_size == 9
+    assert "BATCH_SIZE" not in os.environ
+
+
+def test_process_environment_overrides_env_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BATCH_SIZE", "7")
+    env_file = tmp_path / ".env"
+    env_file.write_text("GOOGLE_API_KEY=test-key\nBATCH_SIZE=5\n")
+    manager = ConfigManager(str(env_file))
+    manager.invalidate()
+
+    assert manager.load_config().batch_size == 7
@@ -0,0 +1,226 @@
+"""
+Tests for transaction deduplication and CSV storage.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import data_processor
+from src.data_processor import (
+    BloomHashSet,
+    append_to_csv,
+    convert_statement_to_records,
+    create_transaction_hashes,
+    get_csv_summary,
+    get_existing_hashes,
+    resolve_existing_hashes,
+)
+from src.schemas import BankStatement, Transaction
+
+
+def make_statement(transactions, account_number="12345678"):
+    """Build a statement around the given transactions."""
+    return BankStatement(
+        account_holder_name="Jane Doe",
+        bank_name="Test Bank",
+        account_number=account_number,
+        sort_code="11-22-33",
+        statement_period="Jan 2024",
+        transactions=transactions,
+    )
+
+
+def make_transactions(count, description="Card payment {}"):
+    """Build distinct debit transactions."""
+    return [
+        Transaction(date="2024-01-01", description=description.format(i), debit=float(i))
+        for i in range(count)
+    ]
+
+
+def write_statement(csv_path, statement, existing_hashes=None):
+    """Convert a statement and append its new records to the CSV."""
+    records, new_hashes = convert_statement_to_records(
+        statement, "statement.pdf", existing_hashes if existing_hashes is not None else set()
+    )
+    append_to_csv(records, str(csv_path))
+    return new_hashes
+
+
+def read_sidecar(csv_path):
+    """Hex hashes stored in the CSV file's hash sidecar."""
+    with open(f"{csv_path}.hashes", encoding='ascii') as sidecar:
+        return sidecar.read().split()
+
+
+def make_csv_newer(csv_path):
+    """Move the CSV file's mtime past its sidecar's."""
+    mtime = os.stat(f"{csv_path}.hashes").st_mtime + 10
+    os.utime(csv_path, (mtime, mtime))
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    return tmp_path / "output" / "transactions.csv"
+
+
+def test_summary_reads_multiline_descriptions(csv_path):
+    # Enough rows that quoted line breaks fall on the reader's block boundaries
+    transactions = make_transactions(30_000, description="line one {}\nline two")
+    write_statement(csv_path, make_statement(transactions))
+
+    summary = get_csv_summary(str(csv_path))
+
+    assert "error" not in summary
+    assert summary["total_transactions"] == 30_000
+    assert summary["unique_accounts"] == 1
+    assert summary["banks"] == ["Test Bank"]
+
+
+def test_existing_hashes_skip_malformed_values(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(100)))
+
+    df = pd.read_csv(csv_path, dtype=str)
+    corrupted = bytes.fromhex(df.loc[0, 'transaction_hash'])
+    df.loc[0, 'transaction_hash'] = "not-a-hash"
+    df.to_csv(csv_path, index=False)
+
+    hashes = get_existing_hashes(str(csv_path))
+    assert hashes == stored - {corrupted}
+
+    # The rebuilt sidecar leaves the malformed value out as well
+    with open(f"{csv_path}.hashes", encoding='ascii') as sidecar:
+        assert "not-a-hash\n" not in sidecar.readlines()
+    assert get_existing_hashes(str(csv_path)) == hashes
+
+
+def test_existing_hashes_switch_to_bloom_filter(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(100)))
+
+    hashes = get_existing_hashes(str(csv_path), chunk_size=10, bloom_threshold=50)
+
+    assert isinstance(hashes, BloomHashSet)
+    assert len(hashes) == 100
+    assert all(digest in hashes for digest in stored)
+    assert hashes.confirm(list(stored)) == stored
+
+
+def test_bloom_filter_confirms_false_positives(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(100)))
+    unknown = create_transaction_hashes("87654321", make_transactions(100))
+
+    # A filter this small has every bit set, so every lookup is a hit
+    hashes = BloomHashSet(str(csv_path), capacity=1, error_rate=0.5)
+    hashes.load(stored)
+    assert all(digest in hashes for digest in unknown)
+
+    assert hashes.confirm(unknown) == set()
+    assert hashes.confirm(unknown + list(stored)) == stored
+
+
+def test_bloom_filter_keeps_pending_hashes(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(10)))
+    hashes = BloomHashSet(str(csv_path), capacity=1, error_rate=0.5)
+    hashes.load(stored)
+
+    # Hashes added during a run are not in the CSV yet but still duplicates
+    statement = make_statement(make_transactions(20))
+    records, new_hashes = convert_statement_to_records(statement, "a.pdf", hashes)
+    assert len(records) == 10
+    hashes |= new_hashes
+
+    assert hashes.confirm(list(new_hashes)) == new_hashes
+    records, _ = convert_statement_to_records(statement, "b.pdf", hashes)
+    assert records.empty
+
+
+def test_resolve_existing_hashes_confirms_all_statements_at_once(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(50)))
+    hashes = get_existing_hashes(str(csv_path), bloom_threshold=10)
+    assert isinstance(hashes, BloomHashSet)
+
+    statements = [
+        make_statement(make_transactions(60)),
+        make_statement(make_transactions(5), account_number="87654321"),
+    ]
+    resolved = resolve_existing_hashes(hashes, statements)
+    assert resolved == stored
+
+    records, new_hashes = convert_statement_to_records(statements[0], "a.pdf", resolved)
+    assert len(records) == 10
+    resolved |= new_hashes
+    records, _ = convert_statement_to_records(statements[1], "b.pdf", resolved)
+    assert len(records) == 5
+
+
+def test_resolve_existing_hashes_keeps_exact_set():
+    hashes = {b"\x00" * 32}
+    assert resolve_existing_hashes(hashes, []) is hashes
+
+
+def test_bloom_filter_loads_in_slices(csv_path):
+    stored = write_statement(csv_path, make_statement(make_transactions(100)))
+
+    hashes = BloomHashSet(str(csv_path), capacity=1000, chunk_size=7)
+    hashes.load(digest for digest in stored)
+
+    assert len(hashes) == 100
+    assert all(digest in hashes for digest in stored)
+    assert hashes.confirm(list(stored)) == stored
+
+
+def test_append_extends_current_sidecar(csv_path):
+    first = write_statement(csv_path, make_statement(make_transactions(10)))
+    assert get_existing_hashes(str(csv_path)) == first
+
+    second = write_statement(
+        csv_path, make_statement(make_transactions(5), account_number="87654321"), first
+    )
+
+    assert sorted(read_sidecar(csv_path)) == sorted(d.hex() for d in first | second)
+    assert get_existing_hashes(str(csv_path)) == first | second
+
+
+def test_newer_csv_rebuilds_sidecar(csv_path):
+    first = write_statement(csv_path, make_statement(make_transactions(10)))
+    get_existing_hashes(str(csv_path))
+
+    # Editing the CSV outside append_to_csv leaves the sidecar stale
+    df = pd.read_csv(csv_path, dtype=str).drop(index=0)
+    df.to_csv(csv_path, index=False)
+    make_csv_newer(csv_path)
+    remaining = {bytes.fromhex(tx_hash) for tx_hash in df['transaction_hash']}
+    assert len(remaining) == len(first) - 1
+
+    # A stale sidecar is not extended by appends either
+    second = write_statement(
+        csv_path, make_statement(make_transactions(5), account_number="87654321"), remaining
+    )
+
+    assert get_existing_hashes(str(csv_path)) == remaining | second
+    assert sorted(read_sidecar(csv_path)) == sorted(d.hex() for d in remaining | second)
+
+
+def test_missing_csv_removes_sidecar(csv_path):
+    write_statement(csv_path, make_statement(make_transactions(10)))
+    get_existing_hashes(str(csv_path))
+    os.remove(csv_path)
+
+    assert get_existing_hashes(str(csv_path)) == set()
+    assert not os.path.exists(f"{csv_path}.hashes")
+
+
+def test_failed_rebuild_leaves_no_sidecar(csv_path, monkeypatch):
+    write_statement(csv_path, make_statement(make_transactions(10)))
+    read_chunks = data_processor._iter_hash_chunks
+
+    def failing_chunks(path, chunk_size):
+        yield next(read_chunks(path, chunk_size))
+        raise OSError("read failed")
+
+    monkeypatch.setattr(data_processor, "_iter_hash_chunks", failing_chunks)
+    get_existing_hashes(str(csv_path), chunk_size=3)
+
+    assert os.listdir(csv_path.parent) == [csv_path.name]
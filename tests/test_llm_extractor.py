@@ -0,0 +1,72 @@
+"""
+Tests for concurrent LLM extraction.
+"""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src import llm_extractor
+from src.llm_extractor import extract_data_with_llm_async, extract_many
+
+
+class StubModels:
+    """Stands in for client.aio.models; statement "<<n>>" comes back as bank "Bank n"."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, model, contents):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            text = re.search(r"<<(\d+)>>", contents).group(1)
+            # Later texts answer sooner, so completion order is reversed
+            await asyncio.sleep(0.01 / (int(text) + 1))
+            if text == "3":
+                raise RuntimeError("quota exceeded")
+            return SimpleNamespace(text=json.dumps({
+                "account_holder_name": "Jane Doe",
+                "bank_name": f"Bank {text}",
+                "account_number": "12345678",
+                "sort_code": "11-22-33",
+                "statement_period": "Jan 2024",
+                "transactions": [],
+            }))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def stub_models(monkeypatch):
+    models = StubModels()
+    client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    monkeypatch.setattr(llm_extractor, "_get_client", lambda api_key: client)
+    return models
+
+
+def test_extract_async_uses_shared_client(stub_models):
+    statement = asyncio.run(extract_data_with_llm_async("<<0>>", "test-key"))
+    assert statement.bank_name == "Bank 0"
+
+
+def test_extract_many_keeps_order_and_bounds_concurrency(stub_models):
+    texts = [f"<<{i}>>" for i in range(8)]
+
+    results = asyncio.run(extract_many(texts, "test-key", concurrency=2))
+
+    assert stub_models.max_in_flight == 2
+    assert [r.bank_name for i, r in enumerate(results) if i != 3] == [
+        f"Bank {i}" for i in range(8) if i != 3
+    ]
+    # A failed request is returned in its place instead of failing the batch
+    assert isinstance(results[3], RuntimeError)
+
+
+def test_extract_many_requires_api_key():
+    with pytest.raises(ValueError):
+        asyncio.run(extract_many(["<<0>>"], ""))
@@ -0,0 +1,62 @@
+"""
+Tests for structured logging helpers.
+"""
+
+import json
+
+import pytest
+import structlog
+
+from src.exceptions import PDFValidationError
+from src.logging_config import LoggerMixin, _orjson_dumps
+
+
+class Worker(LoggerMixin):
+    """Class using the logging mixin."""
+
+
+@pytest.fixture
+def default_structlog():
+    """Run with structlog's default configuration, as before setup_logging()."""
+    structlog.reset_defaults()
+    yield
+    structlog.reset_defaults()
+
+
+def test_mixin_logs_without_setup(default_structlog, capsys):
+    worker = Worker()
+
+    worker.log_operation("Starting work", item="a")
+    worker.log_progress(1, 2, item="a")
+    worker.log_error("Work failed", ValueError("bad input"))
+
+    output = capsys.readouterr().out
+    assert "Starting work" in output
+    assert "Processing progress" in output
+    assert "bad input" in output
+
+
+def test_render_falls_back_for_large_integers():
+    rendered = _orjson_dumps({"event": "big", "value": 2 ** 70}, default=repr)
+    assert json.loads(rendered) == {"event": "big", "value": 2 ** 70}
+
+
+def test_log_error_uses_event_name_and_error_details(default_structlog):
+    worker = Worker()
+
+    with structlog.testing.capture_logs() as logs:
+        worker.log_error(
+            "PDF processing failed",
+            PDFValidationError("File is not a readable PDF", file_path="a.pdf"),
+            event="PDF processing failed",
+            filename="a.pdf",
+        )
+        worker.log_error("Work failed", ValueError("bad input"))
+
+    structured, unexpected = logs
+    assert structured["event"] == "PDF processing failed"
+    assert structured["error_type"] == "PDFValidationError"
+    assert structured["message"] == "File is not a readable PDF"
+    assert structured["filename"] == "a.pdf"
+    assert unexpected["event"] == "Operation failed"
+    assert unexpected["exception_type"] == "ValueError"